@@ -10,12 +10,14 @@ class BaseCfg(BaseModel):
         return self.model_copy(update=kwargs, deep=True)
 
 
-class ControllerCfg(BaseCfg, extra='allow'):
+class ControllerCfg(BaseCfg, extra='allow', frozen=True):
     """
     A specialized model representing controllers within a system, inheriting from BaseModel with an extended configuration to allow additional keys.
 
     This class serves as a data structure to encapsulate controller-related information crucial for configuring and managing control systems, particularly in robotic applications. It provides a structured way to define controllers, including their name, type, sub-controllers (if any), and a reference frame.
 
+    Instances are frozen once validated, use `update` to derive a modified copy.
+
     Attributes:
         name (str): The unique identifier for the controller.
         type (str): Specifies the controller's type or category, determining its behavior and functionality.
@@ -0,0 +1,102 @@
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from internutopia.core.config import Config, TaskCfg
+from internutopia.core.gym_env import acquire_runner, validate_single_agent
+
+
+class EnvState(BaseModel, frozen=True):
+    """
+    Episode state of a functional env, passed explicitly to and returned by :func:`reset` and :func:`step`.
+
+    Attributes:
+        env_id (int): Env id of the episode in the runner.
+        robot_name (Optional[str]): Name of the learning agent, None if episodes have no robot.
+        episode (int): Number of resets done, 0 before the first reset.
+        task_config (Optional[TaskCfg]): Task config of the current episode, None if no episode is running.
+        terminated (bool): Whether the current episode has terminated.
+    """
+
+    env_id: int = 0
+    robot_name: Optional[str] = None
+    episode: int = 0
+    task_config: Optional[TaskCfg] = None
+    terminated: bool = False
+
+
+def make(config: Config, runner=None) -> Tuple[Any, EnvState]:
+    """
+    Create the runner and the initial state for a single env with a single learning agent.
+
+    Args:
+        config (Config): The config instance used for simulation management.
+        runner (SimulatorRunner, optional): Runner created with the same config to share instead of creating
+            one. Each :func:`make` must be paired with a :func:`close`.
+
+    Returns:
+        runner (SimulatorRunner): Runner that owns the simulation, the only stateful part.
+        state (EnvState): Initial state to pass to :func:`reset`.
+    """
+    if config.env_num > 1:
+        raise ValueError(f'Only support single env now, but env num is {config.env_num}')
+    robot_name = validate_single_agent(config)
+    runner = acquire_runner(config, runner)
+    return runner, EnvState(robot_name=robot_name)
+
+
+def close(runner) -> None:
+    """
+    Release the runner returned by :func:`make`, closing the simulation app if nothing else uses it.
+    """
+    runner.release()
+
+
+def reset(runner, state: EnvState) -> Tuple[Dict[str, Any], EnvState]:
+    """
+    Start the next episode.
+
+    Args:
+        runner (SimulatorRunner): Runner returned by :func:`make`.
+        state (EnvState): Current state.
+
+    Returns:
+        observation (Dict[str, Any]): Observation of the initial state, empty if no more episodes left.
+        state (EnvState): New state, with task_config None if no more episodes left.
+    """
+    origin_obs, task_configs = runner.reset(None if state.episode == 0 else [state.env_id])
+    task_config = task_configs[0]
+    new_state = state.model_copy(
+        update={'episode': state.episode + 1, 'task_config': task_config, 'terminated': task_config is None}
+    )
+    if task_config is None or state.robot_name is None:
+        return {}, new_state
+    return origin_obs[0][state.robot_name], new_state
+
+
+def step(runner, state: EnvState, action: Any) -> Tuple[Dict[str, Any], EnvState, float, bool, Dict[str, Any]]:
+    """
+    Run one simulator step with the given action.
+
+    Args:
+        runner (SimulatorRunner): Runner returned by :func:`make`.
+        state (EnvState): Current state.
+        action (Any): an action provided by the agent to update the environment state.
+
+    Returns:
+        observation (Dict[str, Any]): Observation after the step.
+        state (EnvState): New state.
+        reward (float): The reward as a result of taking the action.
+        terminated (bool): Whether the agent reaches the terminal state. If true, call :func:`reset`.
+        info (dict): Currently, it contains nothing.
+    """
+    if state.task_config is None:
+        return {}, state, 0.0, True, {}
+
+    origin_obs, terminated_status, rewards = runner.step([{state.robot_name: action}])
+
+    reward = 0.0 if rewards[state.env_id] == -1 else rewards[state.env_id]
+    terminated = terminated_status[state.env_id]
+    obs = {} if state.robot_name is None else origin_obs[state.env_id][state.robot_name]
+    new_state = state if terminated == state.terminated else state.model_copy(update={'terminated': terminated})
+    return obs, new_state, reward, terminated, {}
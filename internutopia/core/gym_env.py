@@ -1,20 +1,136 @@
-from typing import Any, OrderedDict
+import os
+import queue
+import sys
+from threading import Event, Thread
+from typing import Any, Callable, List, Mapping, Optional, OrderedDict
 
 import gymnasium as gym
+import numpy as np
+from gymnasium.vector.utils import batch_space
 
+import internutopia.core.util.space as space
 from internutopia.core.config import Config
 from internutopia.core.task_config_manager.base import create_task_config_manager
-from internutopia.core.util import log
+from internutopia.core.util import log, remove_suffix
+
+# Set INTERNUTOPIA_LAZY_RUNNER=1 to defer importing the runner until the first env is created.
+_LAZY_RUNNER = os.environ.get('INTERNUTOPIA_LAZY_RUNNER', '0') == '1'
+if not _LAZY_RUNNER:
+    from internutopia.core.runner import SimulatorRunner
+
+
+def get_runner_cls():
+    """Return the SimulatorRunner class, importing it on first use if INTERNUTOPIA_LAZY_RUNNER is set."""
+    if not _LAZY_RUNNER:
+        return SimulatorRunner
+    from internutopia.core.runner import SimulatorRunner as _SimulatorRunner
+
+    return _SimulatorRunner
+
+
+def acquire_runner(config: Config, runner=None):
+    """
+    Acquire `runner` to share it, or a new runner created for `config` if None.
+
+    The simulation app is closed when the last user releases the runner, see `SimulatorRunner.release`.
+    """
+    if runner is None:
+        runner = get_runner_cls()(config=config, task_config_manager=create_task_config_manager(config))
+    runner.acquire()
+    return runner
+
+
+def validate_single_agent(config: Config) -> Optional[str]:
+    """
+    Check that all episodes contain the same robot, and at most one.
+
+    Returns:
+        str | None: Name of the learning agent, None if episodes have no robot.
+    """
+    robot_names = {tuple(remove_suffix(robot.name) for robot in episode.robots) for episode in config.task_configs}
+    if len(robot_names) > 1:
+        raise ValueError(f'Only support the same agent in all episodes, but got {sorted(robot_names)}')
+    _robot_names = next(iter(robot_names))
+
+    if len(_robot_names) == 0:
+        return None
+    if len(_robot_names) != 1:
+        raise ValueError(f'Only support single agent now, but episode requires {len(_robot_names)} agents')
+    # Interned to match the robot name keys of runner obs by identity.
+    return sys.intern(_robot_names[0])
+
+
+# Markers for an env without observation (zero-filled) and a key missing from an env's observation.
+_ABSENT = object()
+_MISSING = object()
+
+
+def _batch_obs(obs_list: List[Any], out: Any = None) -> Any:
+    """
+    Stack per-env observations into the same (nested) dict with arrays of shape `(num_envs, ...)`.
+
+    Keys are the union of the keys of all envs. Numeric array and scalar leaves are stacked if present in every
+    env with the same shape, envs without observation (no running episode) being filled with zeros. Any other
+    leaf (variable shapes, lists, None, missing in some envs) is kept as a per-env list, with None for envs where
+    it is absent. If `out` is given, the dicts and arrays in it are reused whenever structure, shape and dtype
+    still match.
+    """
+    return _batch_values([_ABSENT if obs is None else obs for obs in obs_list], out)
+
+
+def _is_numeric(value: Any) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in 'biufc'
+    return isinstance(value, (bool, int, float, np.generic)) and np.asarray(value).dtype.kind in 'biufc'
+
+
+def _batch_values(values: List[Any], out: Any) -> Any:
+    present = [value for value in values if value is not _ABSENT and value is not _MISSING]
+    if not present:
+        return {}
+    if all(isinstance(value, Mapping) for value in present):
+        out = out if isinstance(out, dict) else {}
+        keys = dict.fromkeys(key for value in present for key in value)
+        for key in [key for key in out if key not in keys]:
+            del out[key]
+        for key in keys:
+            children = [value.get(key, _MISSING) if isinstance(value, Mapping) else value for value in values]
+            out[key] = _batch_values(children, out.get(key))
+        return out
+    if all(value is not _MISSING for value in values) and all(_is_numeric(value) for value in present):
+        arrays = [np.asarray(value) for value in present]
+        if all(array.shape == arrays[0].shape for array in arrays):
+            zeros = np.zeros_like(arrays[0])
+            arrays = iter(arrays)
+            stacked = [zeros if value is _ABSENT else next(arrays) for value in values]
+            if isinstance(out, np.ndarray) and out.shape == (len(values), *zeros.shape) and out.dtype == zeros.dtype:
+                return np.stack(stacked, out=out)
+            return np.stack(stacked)
+    return [None if value is _ABSENT or value is _MISSING else value for value in values]
+
+
+def _copy_obs_into(obs_out: dict, obs: Mapping) -> None:
+    """Copy observation values into the arrays of `obs_out` (a subset of the same nested keys)."""
+    for key, out in obs_out.items():
+        if isinstance(out, dict):
+            _copy_obs_into(out, obs[key])
+        else:
+            np.copyto(out, obs[key])
 
 
 class Env(gym.Env):
     """
     Gym Env for a single environment with a single learning agent.
+
+    Args:
+        config (Config): The config instance used for simulation management.
+        runner (SimulatorRunner, optional): Runner of another env created with the same config, to share its
+            simulator instead of creating one. The simulation app is closed by the last env closed.
     """
 
     RESET_INFO_TASK_CONFIG = 'task_config'
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, runner=None) -> None:
         self._render = None
         self._config = config
         self.env_num = config.env_num
@@ -22,18 +138,24 @@ class Env(gym.Env):
         self._current_task_name = None
         self._validate()
 
-        from internutopia.core.runner import SimulatorRunner  # noqa E402.
+        # Reused across steps, only the action leaf is rebound and the info is cleared.
+        self._action_shell = [{self._robot_name: None}]
+        self._info = {}
 
-        task_config_manager = create_task_config_manager(self._config)
-        self._runner = SimulatorRunner(config=config, task_config_manager=task_config_manager)
+        # Pipeline of the low-level async API (`async_reset`/`send`/`recv`), worker started on first use.
+        # At most one call is pending, so neither queue ever blocks on put.
+        self._requests: queue.Queue = queue.Queue(maxsize=1)
+        self._inflight: queue.Queue = queue.Queue(maxsize=1)
+        self._pending = 0
+        self._stop = Event()
+        self._worker: Optional[Thread] = None
 
-        # ========================= import space ============================
-        import internutopia.core.util.space as space  # noqa E402.
+        self._runner = acquire_runner(config, runner)
+        self._closed = False
 
         self._space = space
         self.action_space = self._get_action_space()
         self.observation_space = self._get_observation_space()
-        # ===================================================================
 
         log.info(f'==================== {self._robot_name} ======================')
         return
@@ -42,16 +164,7 @@ class Env(gym.Env):
         """This method is designed for **only** 1 env + 1 robot."""
         if self.env_num > 1:
             raise ValueError(f'Only support single env now, but env num is {self.env_num}')
-        task_configs = self._config.task_configs
-        _episode_sample = next(iter(task_configs))
-
-        if len(_episode_sample.robots) == 0:
-            return
-        if len(_episode_sample.robots) != 1:
-            raise ValueError(
-                f'Only support single agent now, but episode requires {len(_episode_sample.robots)} agents'
-            )
-        self._robot_name = f'{_episode_sample.robots[0].name}'
+        self._robot_name = validate_single_agent(self._config)
 
     def _get_action_space(self) -> gym.Space:
         return self._space.get_action_space_by_task(self._config)
@@ -71,21 +184,61 @@ class Env(gym.Env):
             observation (OrderedDict): Observation of the initial state.
             info (dict): Contains the key `task_config` if there is an unfinished task
         """
+        self._check_not_pending()
+        return self._reset()
+
+    def _reset(self) -> tuple[OrderedDict | None, dict | None]:
         info = {}
         obs = OrderedDict()
 
-        origin_obs, task_configs = self.runner.reset(None if self._current_task_name is None else [0])
-        if None in task_configs:
+        origin_obs, task_config = self._reset_runner()
+        if task_config is None:
             log.info('No more episodes left')
             return None, None
 
-        self._current_task_name = list(self.runner.task_name_to_env_id_map.keys())[0]
-        info[Env.RESET_INFO_TASK_CONFIG] = task_configs[0]
+        info[Env.RESET_INFO_TASK_CONFIG] = task_config
         if self._robot_name:
             obs = origin_obs[0][self._robot_name]
 
         return obs, info
 
+    def _reset_runner(self, collect_obs: bool = True) -> tuple[list, Any]:
+        origin_obs, task_configs = self.runner.reset(
+            None if self._current_task_name is None else [0], collect_obs=collect_obs
+        )
+        if None in task_configs:
+            return origin_obs, None
+
+        self._current_task_name = list(self.runner.task_name_to_env_id_map.keys())[0]
+        return origin_obs, task_configs[0]
+
+    def reset_and_step(self, action: Any, *, seed=None, options=None) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        """Resets the environment and runs the first step of the new episode with the given action.
+
+        Same as :meth:`reset` followed by :meth:`step`, except that the observation of the initial state,
+        which would be discarded, is not collected from the simulator.
+
+        Args:
+            action (Any): an action provided by the agent for the first step.
+            seed (optional int): The seed that is used to initialize the environment's PRNG (`np_random`).
+            options (optional dict): Additional information to specify how the environment is reset (optional,
+                depending on the specific environment)
+
+        Returns:
+            The same tuple as :meth:`step`, with the key `task_config` of the new episode in info. Unlike the
+            info of :meth:`step`, this dict is not reused by later steps.
+            If no more episodes are left, observation is None and terminated is True.
+        """
+        self._check_not_pending()
+        _, task_config = self._reset_runner(collect_obs=False)
+        if task_config is None:
+            log.info('No more episodes left')
+            return None, 0.0, True, False, {}
+
+        obs, reward, terminated, truncated, info = self._step(action)
+        # A new dict, as the one of :meth:`step` is cleared on the next step.
+        return obs, reward, terminated, truncated, {**info, Env.RESET_INFO_TASK_CONFIG: task_config}
+
     def warm_up(self, steps: int = 10, render: bool = True, physics: bool = True):
         """
         Warm up the env by running a specified number of steps.
@@ -95,9 +248,10 @@ class Env(gym.Env):
             render (bool): Whether to render the scene during warm-up. Defaults to True.
             physics (bool): Whether to enable physics during warm-up. Defaults to True.
         """
+        self._check_not_pending()
         self.runner.warm_up(steps, render, physics)
 
-    def step(self, action: Any) -> tuple[Any, float, bool, bool, dict[str, Any] | None]:
+    def step(self, action: Any) -> tuple[Any, float, bool, bool, dict[str, Any]]:
         """
         run step with given action(with isaac step)
 
@@ -115,30 +269,173 @@ class Env(gym.Env):
                 Can be used to end the episode prematurely before a terminal state is reached.
                 If true, the user needs to call :meth:`reset`.
             info (dict): Contains auxiliary diagnostic information (helpful for debugging, learning, and logging).
-                Currently, it contains nothing.
+                Currently, it contains nothing. The same dict object is returned on every step.
         """
+        self._check_not_pending()
+        return self._step(action)
 
+    def _step(self, action: Any) -> tuple[Any, float, bool, bool, dict[str, Any]]:
         obs = {}
         reward = 0.0
         terminated = False
         truncated = False
-        info = None
+        info = self._info
+        info.clear()
 
         if self._current_task_name is None:
             return obs, reward, terminated, truncated, info
 
-        _actions = [{self._robot_name: action}]
-        origin_obs, terminated_status, rewards = self._runner.step(_actions)
+        robot_name = self._robot_name
+        action_shell = self._action_shell
+        action_shell[0][robot_name] = action
+        origin_obs, terminated_status, rewards = self._runner.step(action_shell)
 
         if rewards[0] != -1:
             reward = rewards[0]
 
-        if self._robot_name:
-            obs = origin_obs[0][self._robot_name]
+        if robot_name:
+            obs = origin_obs[0][robot_name]
         terminated = terminated_status[0]
 
         return obs, reward, terminated, truncated, info
 
+    def step_into(
+        self, action: Any, obs_out: dict, rew_out: np.ndarray, done_out: np.ndarray, trunc_out: np.ndarray
+    ) -> None:
+        """
+        Same as :meth:`step`, but writes the results into caller-allocated buffers.
+
+        Args:
+            action (Any): an action provided by the agent to update the environment state.
+            obs_out (dict): Arrays to copy the observation into, nested like the observation. Only the keys
+                present in `obs_out` are copied. Left untouched if there is no observation.
+            rew_out (np.ndarray): Buffer whose element 0 receives the reward.
+            done_out (np.ndarray): Buffer whose element 0 receives the terminated flag.
+            trunc_out (np.ndarray): Buffer whose element 0 receives the truncated flag.
+        """
+        self._check_not_pending()
+        obs, rew_out[0], done_out[0], trunc_out[0], _ = self._step(action)
+        if obs:
+            _copy_obs_into(obs_out, obs)
+
+    def rollout(self, policy_fn: Callable[[Any], Any], n_steps: int, obs: Any = None) -> dict[str, Any]:
+        """
+        Run up to `n_steps` steps with actions from `policy_fn`, stopping early when the episode ends.
+
+        Args:
+            policy_fn (Callable[[Any], Any]): Maps an observation to an action.
+            n_steps (int): Maximum number of steps.
+            obs (Any, optional): Observation to start from, e.g. the one returned by :meth:`reset`. Defaults to
+                the result of :meth:`get_observations`.
+
+        Returns:
+            dict: Trajectory of the `T <= n_steps` steps run, with keys:
+                - obs: Observations the actions were taken from, batched per key over the union of keys of all
+                  steps. Numeric leaves of constant shape are stacked with shape `(T, ...)`, others (variable
+                  shapes, keys missing in some steps) are kept as per-step lists.
+                - actions (list): Actions returned by `policy_fn`.
+                - rewards, terminated, truncated (np.ndarray): Step results of shape `(T,)`.
+                - last_obs: Observation after the last step.
+        """
+        self._check_not_pending()
+        if obs is None:
+            obs = self.get_observations()
+        step = self._step
+        obs_list = []
+        actions = []
+        rewards = np.zeros(n_steps, dtype=np.float32)
+        terminated = np.zeros(n_steps, dtype=bool)
+        truncated = np.zeros(n_steps, dtype=bool)
+
+        t = 0
+        while t < n_steps:
+            action = policy_fn(obs)
+            obs_list.append(obs)
+            actions.append(action)
+            obs, rewards[t], terminated[t], truncated[t], _ = step(action)
+            t += 1
+            if terminated[t - 1] or truncated[t - 1]:
+                break
+
+        return {
+            'obs': _batch_obs(obs_list),
+            'actions': actions,
+            'rewards': rewards[:t],
+            'terminated': terminated[:t],
+            'truncated': truncated[:t],
+            'last_obs': obs,
+        }
+
+    def async_reset(self) -> None:
+        """
+        Reset the environment in the background, the result is returned by the next :meth:`recv`.
+
+        The reset must be issued exactly once before the first :meth:`send`. Simulation of the pipelined
+        calls (`runner.reset`/`runner.step`) runs in a worker thread, not the main thread, so the caller can
+        compute the next action meanwhile. The pipeline depth is one: :meth:`async_reset` and :meth:`send` raise
+        RuntimeError while the result of the previous call has not been received by :meth:`recv`. Do not mix
+        with the synchronous API: :meth:`reset`, :meth:`step` and the other calls driving the runner raise
+        RuntimeError while a call is pending.
+        """
+        self._submit(self._reset_as_step, None)
+
+    def send(self, action: Any) -> None:
+        """
+        Submit an action to be stepped in the background, the result is returned by the next :meth:`recv`.
+
+        Args:
+            action (Any): an action provided by the agent to update the environment state.
+
+        Raises:
+            RuntimeError: If the result of the previous :meth:`async_reset` or :meth:`send` was not received.
+        """
+        self._submit(self._step, action)
+
+    def recv(self) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        """
+        Wait for the result of the last :meth:`async_reset` or :meth:`send`.
+
+        Returns:
+            The same tuple as :meth:`step`. After :meth:`async_reset`, info is the info of :meth:`reset`.
+        """
+        if not self._pending:
+            raise RuntimeError('recv called without a pending async_reset or send')
+        result = self._inflight.get()
+        self._pending -= 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _check_not_pending(self):
+        if self._pending:
+            raise RuntimeError('An async call is pending, recv it before using the synchronous API')
+
+    def _reset_as_step(self, _) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        obs, info = self._reset()
+        return obs, 0.0, False, False, info
+
+    def _submit(self, func: Callable[[Any], Any], arg: Any):
+        if self._pending:
+            raise RuntimeError('An async call is pending, recv it before submitting another one')
+        if self._worker is None:
+            self._worker = Thread(target=self._work, daemon=True)
+            self._worker.start()
+        self._pending += 1
+        self._requests.put((func, arg))
+
+    def _work(self):
+        while not self._stop.is_set():
+            request = self._requests.get()
+            if request is None:
+                return
+            func, arg = request
+            try:
+                result = func(arg)
+            except Exception as e:
+                log.error(f'Async env call failed: {e}')
+                result = e
+            self._inflight.put(result)
+
     @property
     def runner(self):
         return self._runner
@@ -166,6 +463,7 @@ class Env(gym.Env):
         Returns:
             observation (gym.Space): observation
         """
+        self._check_not_pending()
         if self._current_task_name is None:
             return {}
 
@@ -178,8 +476,26 @@ class Env(gym.Env):
         pass
 
     def close(self):
-        """close the environment"""
-        self.runner.simulation_app.close()
+        """close the environment, the simulation app is closed once no env uses the runner"""
+        if self._closed:
+            return
+        if self._worker is not None:
+            # Unblock the worker whether it waits for a request or for its undrained result to be received.
+            self._stop.set()
+            while self._worker.is_alive():
+                try:
+                    self._inflight.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self._requests.put_nowait(None)
+                except queue.Full:
+                    pass
+                self._worker.join(timeout=0.1)
+            self._worker = None
+            self._pending = 0
+        self._closed = True
+        self.runner.release()
         return
 
     @property
@@ -190,3 +506,169 @@ class Env(gym.Env):
     def finished(self) -> bool:
         """check if all tasks are finished"""
         return len(self._runner.current_tasks) == 0
+
+
+class VectorEnv(gym.vector.VectorEnv):
+    """
+    Gym VectorEnv for `env_num` environments with a single learning agent each, stepped by one simulator.
+
+    Observations are batched per key with a leading `num_envs` dimension (struct of arrays), and actions
+    are either a sequence of per-env actions or a dict of batched actions. The returned observation dict
+    and its arrays are reused across calls, so callers can keep zero-copy views (e.g. `torch.from_numpy`)
+    on them and must copy what they need to keep.
+
+    Args:
+        config (Config): The config instance used for simulation management.
+        runner (SimulatorRunner, optional): Runner of another env created with the same config, to share its
+            simulator instead of creating one. The simulation app is closed by the last env closed.
+    """
+
+    RESET_INFO_TASK_CONFIG = 'task_config'
+
+    def __init__(self, config: Config, runner=None) -> None:
+        self._render = None
+        self._config = config
+        self.num_envs = config.env_num
+        self._robot_name = validate_single_agent(self._config)
+        self._initialized = False
+        self._last_obs: List[Any] = [None for _ in range(self.num_envs)]
+        self._obs_buf: dict = {}
+        # Reused across steps, only the action leaves are rebound.
+        self._action_shells = [{self._robot_name: None} for _ in range(self.num_envs)]
+
+        self._runner = acquire_runner(config, runner)
+
+        self.single_action_space = space.get_action_space_by_task(self._config)
+        self.single_observation_space = space.get_observation_space_by_task(self._config)
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+        self.observation_space = batch_space(self.single_observation_space, self.num_envs)
+
+        log.info(f'==================== {self._robot_name} x {self.num_envs} ======================')
+        return
+
+    def _update_obs(self, origin_obs: List[Any], env_ids: List[int]) -> Any:
+        if self._robot_name:
+            for env_id, task_obs in zip(env_ids, origin_obs):
+                self._last_obs[env_id] = None if task_obs is None else task_obs[self._robot_name]
+        self._obs_buf = _batch_obs(self._last_obs, self._obs_buf)
+        return self._obs_buf
+
+    def reset(self, *, seed=None, options=None) -> tuple[dict, dict]:
+        """Resets the environments, returning batched initial observations and info.
+
+        Args:
+            seed (optional int): The seed that is used to initialize the environment's PRNG (`np_random`).
+            options (optional dict): Supports key `env_ids` (List[int]) to reset only part of the envs.
+
+        Returns:
+            observation (dict): Batched observations of all envs.
+            info (dict): Contains the key `task_config`, a list of new task configs of the reset envs
+                (None for envs with no more episodes).
+        """
+        env_ids = None if options is None else options.get('env_ids')
+        if env_ids is None and self._initialized:
+            env_ids = list(range(self.num_envs))
+
+        origin_obs, task_configs = self._runner.reset(env_ids)
+        self._initialized = True
+        if all(task_config is None for task_config in task_configs):
+            log.info('No more episodes left')
+
+        obs = self._update_obs(origin_obs, list(range(self.num_envs)) if env_ids is None else env_ids)
+        return obs, {VectorEnv.RESET_INFO_TASK_CONFIG: task_configs}
+
+    def warm_up(self, steps: int = 10, render: bool = True, physics: bool = True):
+        """
+        Warm up the env by running a specified number of steps.
+
+        Args:
+            steps (int): The number of warm-up steps to perform. Defaults to 10.
+            render (bool): Whether to render the scene during warm-up. Defaults to True.
+            physics (bool): Whether to enable physics during warm-up. Defaults to True.
+        """
+        self._runner.warm_up(steps, render, physics)
+
+    def step(self, actions: Any) -> tuple[dict, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        Run one simulator step for all envs with the given batched actions.
+
+        Args:
+            actions (Any): Sequence of per-env actions, or dict of actions batched along the first dimension.
+
+        Returns:
+            observation (dict): Batched observations of all envs.
+            reward (np.ndarray): Rewards of shape `(num_envs,)`.
+            terminated (np.ndarray): Terminated flags of shape `(num_envs,)`. Envs with no running episode
+                are always terminated.
+            truncated (np.ndarray): Truncated flags of shape `(num_envs,)`.
+            info (dict): Currently, it contains nothing.
+        """
+        robot_name = self._robot_name
+        action_shells = self._action_shells
+        if isinstance(actions, Mapping):
+            batched_items = list(actions.items())
+            for env_id, action_shell in enumerate(action_shells):
+                action_shell[robot_name] = {k: v[env_id] for k, v in batched_items}
+        else:
+            for env_id, action_shell in enumerate(action_shells):
+                action_shell[robot_name] = actions[env_id]
+
+        origin_obs, terminated_status, rewards = self._runner.step(action_shells)
+
+        obs = self._update_obs(origin_obs, list(range(self.num_envs)))
+        reward = np.array([0.0 if r == -1 else r for r in rewards], dtype=np.float32)
+        terminated = np.array(terminated_status, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+
+        return obs, reward, terminated, truncated, {}
+
+    @property
+    def runner(self):
+        return self._runner
+
+    @property
+    def is_render(self):
+        return self._render
+
+    @property
+    def active_task_configs(self):
+        return self._runner.task_config_manager.get_active_task_configs()
+
+    def get_dt(self):
+        """
+        Get dt of simulation environment.
+        Returns:
+            dt.
+        """
+        return self._runner.dt
+
+    def get_observations(self) -> dict:
+        """
+        Get batched observations from Isaac environment
+
+        Returns:
+            observation (dict): Batched observations of all envs.
+        """
+        if not self._initialized:
+            return {}
+        return self._update_obs(self._runner.get_obs(), list(range(self.num_envs)))
+
+    def close_extras(self, **kwargs):
+        """close the environment, the simulation app is closed once no env uses the runner"""
+        self._runner.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+        return False
+
+    @property
+    def simulation_app(self):
+        """simulation app instance"""
+        return self._runner.simulation_app
+
+    def finished(self) -> bool:
+        """check if all tasks are finished"""
+        return len(self._runner.current_tasks) == 0
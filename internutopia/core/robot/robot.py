@@ -1,3 +1,4 @@
+import sys
 from collections import OrderedDict
 from typing import Any, Dict, List, Tuple
 
@@ -236,7 +237,8 @@ def create_robots(task_config: TaskCfg, scene: IScene) -> OrderedDict[str, BaseR
             raise KeyError(f'[create_robots] unknown robot type "{robot.type}"')
         robot_cls = BaseRobot.robots[robot.type]
         robot_ins: BaseRobot = robot_cls(robot, scene)
-        robot_map[remove_suffix(robot.name)] = robot_ins
+        # Interned as obs of robots are looked up by this name on every step.
+        robot_map[sys.intern(remove_suffix(robot.name))] = robot_ins
         robot_ins.set_up_to_scene(scene)
         log.debug(f'[create_robots] {robot.name} loaded')
     return robot_map
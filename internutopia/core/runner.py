@@ -49,6 +49,9 @@ class SimulatorRunner:
         self.loop = False
         self._render = False
 
+        # Number of envs using this runner, the simulation app is closed when the last one is released.
+        self._refcount = 0
+
     @property
     def current_tasks(self) -> dict[str, BaseTask]:
         return self._world._current_tasks
@@ -208,20 +211,13 @@ class SimulatorRunner:
         Returns:
             List[Dict]: obs from isaac sim.
         """
-        obs = {}
+        _obs = [None for _ in range(self.env_num)]
         for task_name, task in self.current_tasks.items():
-            obs[task_name] = task.get_observations()
-        # Add render obs
-        for task_name, task_obs in obs.items():
-            for robot_name, robot_obs in task_obs.items():
-                obs[task_name][robot_name]['render'] = self._render
-
-        _obs = []
-        for env_id in range(self.env_num):
-            if env_id in self.env_id_to_task_name_map:
-                _obs.append(obs[self.env_id_to_task_name_map[env_id]])
-            else:
-                _obs.append(None)
+            task_obs = task.get_observations()
+            # Add render obs
+            for robot_obs in task_obs.values():
+                robot_obs['render'] = self._render
+            _obs[self.task_name_to_env_id_map[task_name]] = task_obs
         return _obs
 
     def stop(self):
@@ -235,7 +231,7 @@ class SimulatorRunner:
     def get_current_time_step_index(self) -> int:
         return self._world.current_time_step_index
 
-    def reset(self, env_ids: Optional[List[int]] = None) -> Tuple[List, List]:
+    def reset(self, env_ids: Optional[List[int]] = None, collect_obs: bool = True) -> Tuple[List, List]:
         """
         Resets the environment for the given environment IDs or initializes it if no IDs are provided.
         This method handles resetting the simulation context, generating new task configs, and finalizing
@@ -245,6 +241,8 @@ class SimulatorRunner:
         Args:
             env_ids (Optional[List[int]]): A list of environment IDs to reset. If None, all environments
                 are reset or initialized based on the current state.
+            collect_obs (bool): Whether to collect observations after the reset. If False, observations are
+                all None, which saves the sensor reads when the caller steps right away. Defaults to True.
 
         Returns:
             Tuple[List, List]: A tuple containing two lists. The first list contains observations for
@@ -291,8 +289,11 @@ class SimulatorRunner:
                     new_task_configs.append(None)
             [self.finished_tasks.discard(task) for task in tasks]
 
-        all_obs = self.get_obs()
-        obs = [all_obs[i] for i in env_ids] if env_ids else all_obs
+        if collect_obs:
+            all_obs = self.get_obs()
+            obs = [all_obs[i] for i in env_ids] if env_ids else all_obs
+        else:
+            obs = [None for _ in (env_ids if env_ids else range(self.env_num))]
 
         if not self.current_tasks:
             # finished
@@ -528,6 +529,23 @@ class SimulatorRunner:
             self._simulation_app.set_setting('/app/window/drawMouse', True)
             enable_extension('omni.kit.livestream.webrtc')
 
+    def acquire(self):
+        """
+        Register a user (e.g. an env) of this runner, see :meth:`release`.
+        """
+        self._refcount += 1
+
+    def release(self):
+        """
+        Unregister a user of this runner, and close the simulation app when no user is left.
+        """
+        if self._refcount <= 0:
+            log.warning('Release a runner that is not acquired.')
+            return
+        self._refcount -= 1
+        if self._refcount == 0:
+            self._simulation_app.close()
+
     @property
     def simulation_app(self):
         return self._simulation_app
@@ -1,3 +1,4 @@
+import sys
 import traceback
 from abc import ABC
 from typing import Any, Dict, List, Union
@@ -63,7 +64,7 @@ class BaseTask(ABC):
         if env_id not in PoseMixin.env_offset_map:
             PoseMixin.env_offset_map[str(env_id)] = env_offset
             log.info(f'env {env_id} at {env_offset}')
-        self.name = task_name
+        self.name = sys.intern(task_name)
         for metric in self.metrics.values():
             metric.set_up_runtime(task_name, env_id, env_offset)
 
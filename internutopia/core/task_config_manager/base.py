@@ -1,13 +1,20 @@
 import socket
+from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
-from internutopia.core.config import Config, DistributedConfig, TaskCfg
+from internutopia.core.config import Config, DistributedConfig, RobotCfg, TaskCfg
+
+
+def copy_robot_cfg(robot: RobotCfg) -> RobotCfg:
+    """Deep copy a robot cfg, sharing its (frozen) controller cfgs by reference."""
+    memo = {id(controller): controller for controller in robot.controllers or []}
+    return deepcopy(robot, memo)
 
 
 def setup_offset_for_assets(task_config: TaskCfg, env_id: int, offset: List[float]):
     root_path = f'/World/env_{str(env_id)}'
 
-    task_config.robots = [r.model_copy(deep=True) for r in task_config.robots]
+    task_config.robots = [copy_robot_cfg(r) for r in task_config.robots]
     task_config.objects = [o.model_copy(deep=True) for o in task_config.objects if task_config.objects]
 
     for r in task_config.robots:
@@ -46,18 +53,12 @@ class BaseTaskConfigManager:
             raise RuntimeError('env_num must be greater than 0')
 
     def validate_task_configs(self):
-        task_cfg_count = 0
-        _order = None
-        for idx, episode in enumerate(self.task_configs):
-            task_cfg_count += 1
-            robot_order = [robot.type for robot in episode.robots]
-            if _order is None:
-                _order = robot_order
-                continue
-            if robot_order != _order:
-                raise ValueError('robot types must be identical across all episodes')
+        task_cfg_count = len(self.task_configs)
         if task_cfg_count == 0:
             raise RuntimeError('The len of task_configs must be greater than 0')
+        robot_orders = {tuple(robot.type for robot in episode.robots) for episode in self.task_configs}
+        if len(robot_orders) > 1:
+            raise ValueError('robot types must be identical across all episodes')
         return task_cfg_count
 
     def get_active_task_configs(self) -> Dict[int, TaskCfg]:
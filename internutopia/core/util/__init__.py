@@ -1,34 +1,18 @@
 import os
+from functools import lru_cache
 
 from internutopia.core.util.async_req import AsyncRequest
 from internutopia.core.util.log import log
 
-if not AsyncRequest.loop:
-    AsyncRequest.start_loop()
-
 
+@lru_cache(maxsize=1)
 def is_in_container() -> bool:
-    try:
-        os.stat('/.dockerenv')
-        return True
-    except FileNotFoundError:
-        return False
-    except Exception as e:
-        log.error(f'Error while checking if in container, assume False: {e}')
-        return False
+    return os.path.exists('/.dockerenv')
 
 
+@lru_cache(maxsize=1)
 def has_display() -> bool:
-    try:
-        display = os.environ['DISPLAY']
-        if display is not None and display != '':
-            return True
-        return False
-    except KeyError:
-        return False
-    except Exception as e:
-        log.error(f'Error while checking if has display, assume False: {e}')
-        return False
+    return bool(os.environ.get('DISPLAY', ''))
 
 
 def remove_suffix(name: str) -> str:
@@ -1,6 +1,6 @@
 import asyncio
 import logging.config
-from threading import Thread
+from threading import Lock, Thread
 from typing import Tuple
 
 import httpx
@@ -39,6 +39,7 @@ def start_loop(loop):
 class AsyncRequest:
     loop = None
     res_info = {}
+    _loop_lock = Lock()
 
     def __init__(self):
         pass
@@ -55,6 +56,7 @@ class AsyncRequest:
         Returns:
 
         """
+        cls._ensure_loop()
         key = url + request_id
         if key not in cls.res_info:
             cls.res_info[key] = None
@@ -72,6 +74,7 @@ class AsyncRequest:
 
     @classmethod
     def post(cls, request_id, url, json, **kwargs):
+        cls._ensure_loop()
         key = url + request_id
         if key not in cls.res_info:
             cls.res_info[key] = None
@@ -96,3 +99,12 @@ class AsyncRequest:
         t = Thread(target=start_loop, args=(message_send_loop,))
         t.daemon = True
         t.start()
+        cls.loop = message_send_loop
+
+    @classmethod
+    def _ensure_loop(cls):
+        """Start the event loop thread on first request."""
+        if cls.loop is None:
+            with cls._loop_lock:
+                if cls.loop is None:
+                    cls.start_loop()
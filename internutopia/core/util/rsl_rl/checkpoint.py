@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+import torch
+
+
+@lru_cache(maxsize=None)
+def load_checkpoint(path: str, pickle_module=None) -> dict:
+    """
+    Load a policy checkpoint once per process, memory-mapped on cpu.
+
+    The returned dict is shared by all callers and must be treated as read-only (e.g. only passed to
+    `load_state_dict`, which copies the tensors).
+
+    Args:
+        path (str): Path of the checkpoint saved by `torch.save`.
+        pickle_module (optional): Module used for unpickling, default to the one of `torch.load`.
+    """
+    kwargs = {} if pickle_module is None else {'pickle_module': pickle_module}
+    return torch.load(path, map_location='cpu', mmap=True, **kwargs)
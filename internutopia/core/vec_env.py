@@ -25,6 +25,7 @@ class Env:
         self.env_num = self._config.env_num
         self.proc_num = 1
         self.is_remote = False
+        self._closed = False
         if isinstance(config, DistributedConfig):
             import ray
 
@@ -45,6 +46,7 @@ class Env:
                 self._runner_list.append(Launcher(self._config, self.task_config_manager).start())
         else:
             self._runner_list.append(Launcher(self._config, self.task_config_manager).start())
+            self._runner_list[0].runner.acquire()
 
         return
 
@@ -205,9 +207,12 @@ class Env:
         return obs
 
     def close(self):
-        """Close the environment"""
+        """Close the environment, closing it again is a no-op"""
+        if self._closed:
+            return
+        self._closed = True
         if not self.is_remote:
-            self._runner_list[0].runner.simulation_app.close()
+            self._runner_list[0].runner.release()
         else:
             import ray
 
@@ -215,6 +220,13 @@ class Env:
                 ray.kill(proxy.runner)
             ray.kill(self.task_config_manager)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+        return False
+
     @property
     def simulation_app(self):
         """Simulation app instance"""
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from internutopia.core.config.robot import ControllerCfg
 
@@ -6,5 +6,5 @@ from internutopia.core.config.robot import ControllerCfg
 class AliengoMoveBySpeedControllerCfg(ControllerCfg):
 
     type: Optional[str] = 'AliengoMoveBySpeedController'
-    joint_names: List[str]
+    joint_names: Tuple[str, ...]
     policy_weights_path: str
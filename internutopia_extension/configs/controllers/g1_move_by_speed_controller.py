@@ -1,9 +1,9 @@
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from internutopia.core.config.robot import ControllerCfg
 
 
 class G1MoveBySpeedControllerCfg(ControllerCfg):
     type: Optional[str] = 'G1MoveBySpeedController'
-    joint_names: List[str]
+    joint_names: Tuple[str, ...]
     policy_weights_path: str
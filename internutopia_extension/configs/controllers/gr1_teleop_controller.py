@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from internutopia.core.config.robot import ControllerCfg
 
@@ -6,4 +6,4 @@ from internutopia.core.config.robot import ControllerCfg
 class GR1TeleOpControllerCfg(ControllerCfg):
 
     type: Optional[str] = 'GR1TeleOpController'
-    joint_names: List[str]
+    joint_names: Tuple[str, ...]
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from internutopia.core.config.robot import ControllerCfg
 
@@ -6,4 +6,4 @@ from internutopia.core.config.robot import ControllerCfg
 class JointControllerCfg(ControllerCfg):
 
     type: Optional[str] = 'JointController'
-    joint_names: List[str]
+    joint_names: Tuple[str, ...]
@@ -11,6 +11,7 @@ from internutopia.core.robot.articulation_subset import ArticulationSubset
 from internutopia.core.robot.controller import BaseController
 from internutopia.core.robot.robot import BaseRobot
 from internutopia.core.scene.scene import IScene
+from internutopia.core.util.rsl_rl.checkpoint import load_checkpoint
 from internutopia_extension.configs.controllers import AliengoMoveBySpeedControllerCfg
 from internutopia_extension.controllers.models.aliengo.actor_critic import ActorCritic
 
@@ -36,7 +37,7 @@ class RLPolicy:
         self.actor_critic = ActorCritic(num_obs, num_critic_obs, one_step_obs, env_actions, **self.policy_cfg)
         self.alg = PPO(self.actor_critic, device='cuda:0')
 
-        loaded_dict = torch.load(path)
+        loaded_dict = load_checkpoint(path)
         self.alg.actor_critic.load_state_dict(loaded_dict['model_state_dict'])
         if load_optimizer:
             self.alg.optimizer.load_state_dict(loaded_dict['optimizer_state_dict'])
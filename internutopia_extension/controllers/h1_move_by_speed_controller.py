@@ -12,6 +12,7 @@ from internutopia.core.robot.controller import BaseController
 from internutopia.core.robot.robot import BaseRobot
 from internutopia.core.scene.scene import IScene
 from internutopia.core.util.rsl_rl import pickle
+from internutopia.core.util.rsl_rl.checkpoint import load_checkpoint
 from internutopia_extension.configs.controllers import H1MoveBySpeedControllerCfg
 
 
@@ -35,7 +36,7 @@ class RLPolicy:
         self.load(path=path)
 
     def load(self, path: str, load_optimizer=False):
-        loaded_dict = torch.load(path, pickle_module=pickle)
+        loaded_dict = load_checkpoint(path, pickle_module=pickle)
         self.actor_critic.load_state_dict(loaded_dict['model_state_dict'])
         if self.empirical_normalization:
             self.obs_normalizer.load_state_dict(loaded_dict['obs_norm_state_dict'])
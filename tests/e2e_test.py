@@ -135,3 +135,51 @@ def test_vec_env_robots():
         'set -e; ls ./tests/vec_env_robots/*.py | grep -v test_ | while read f; do echo "run $f" && python $f; done'
     )
     common_body(start_command)
+
+
+@pytest.mark.P0
+def test_h1_locomotion_vector_env():
+    start_command = 'python ./tests/h1_locomotion_vector_env.py'
+    common_body(start_command)
+
+
+@pytest.mark.P0
+def test_h1_locomotion_async_env():
+    start_command = 'python ./tests/h1_locomotion_async_env.py'
+    common_body(start_command)
+
+
+@pytest.mark.P0
+def test_h1_locomotion_func_env():
+    start_command = 'python ./tests/h1_locomotion_func_env.py'
+    common_body(start_command)
+
+
+@pytest.mark.P0
+def test_h1_locomotion_shared_runner():
+    start_command = 'python ./tests/h1_locomotion_shared_runner.py'
+    common_body(start_command)
+
+
+@pytest.mark.P0
+def test_h1_locomotion_multi_env_context():
+    start_command = 'python ./tests/h1_locomotion_multi_env_context.py'
+    common_body(start_command)
+
+
+@pytest.mark.P0
+def test_h1_locomotion_reset_and_step():
+    start_command = 'python ./tests/h1_locomotion_reset_and_step.py'
+    common_body(start_command)
+
+
+@pytest.mark.P0
+def test_h1_locomotion_rollout():
+    start_command = 'python ./tests/h1_locomotion_rollout.py'
+    common_body(start_command)
+
+
+@pytest.mark.P0
+def test_h1_locomotion_step_into():
+    start_command = 'python ./tests/h1_locomotion_step_into.py'
+    common_body(start_command)
@@ -0,0 +1,107 @@
+def main():
+    from internutopia.core.config import Config, SimConfig
+    from internutopia.core.gym_env import Env
+    from internutopia.core.util import has_display
+    from internutopia.macros import gm
+    from internutopia_extension import import_extensions
+    from internutopia_extension.configs.robots.h1 import (
+        H1RobotCfg,
+        move_along_path_cfg,
+        move_by_speed_cfg,
+        rotate_cfg,
+    )
+    from internutopia_extension.configs.tasks import FiniteStepTaskCfg
+
+    headless = False
+    if not has_display():
+        headless = True
+
+    h1 = H1RobotCfg(
+        position=(0.0, 0.0, 1.05),
+        controllers=[
+            move_by_speed_cfg,
+            move_along_path_cfg,
+            rotate_cfg,
+        ],
+        sensors=[],
+    )
+
+    config = Config(
+        simulator=SimConfig(physics_dt=1 / 240, rendering_dt=1 / 240, use_fabric=True, headless=headless),
+        task_configs=[
+            FiniteStepTaskCfg(
+                max_steps=300,
+                scene_asset_path=gm.ASSET_PATH + '/scenes/empty.usd',
+                scene_scale=(0.01, 0.01, 0.01),
+                robots=[h1],
+            )
+            for _ in range(2)
+        ],
+    )
+
+    print(config.model_dump_json(indent=4))
+
+    import_extensions()
+
+    env = Env(config)
+    env.async_reset()
+    obs, _, _, _, info = env.recv()
+    assert 'position' in obs and Env.RESET_INFO_TASK_CONFIG in info
+
+    i = 0
+    move_action = {move_by_speed_cfg.name: [1, 0, 0]}
+
+    # First episode fully pipelined, with the synchronous API rejected while a step is pending.
+    env.send(move_action)
+    while env.simulation_app.is_running():
+        i += 1
+        if i == 1:
+            try:
+                env.step(move_action)
+                raise AssertionError('step should raise while an async step is pending')
+            except RuntimeError:
+                pass
+        obs, _, terminated, _, _ = env.recv()
+        if terminated:
+            break
+        env.send(move_action)
+        if i % 100 == 0:
+            print(i)
+            pos = obs['position']
+            assert pos[0] < 5.0 and pos[1] < 5.0 and pos[2] < 2.0, 'out of range'
+
+    assert i > 200, 'episode ended before max steps'
+
+    # The synchronous API is usable again once every result has been received.
+    obs, info = env.reset()
+    assert 'position' in obs and Env.RESET_INFO_TASK_CONFIG in info
+    env.step(move_action)
+
+    # The pipeline depth is one: further calls are rejected instead of blocking.
+    env.send(move_action)
+    for _ in range(3):
+        try:
+            env.send(move_action)
+            raise AssertionError('send should raise while an async step is pending')
+        except RuntimeError:
+            pass
+    try:
+        env.async_reset()
+        raise AssertionError('async_reset should raise while an async step is pending')
+    except RuntimeError:
+        pass
+
+    # Closing with an undrained result must not block.
+    env.close()
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f'exception is {e}')
+        import sys
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
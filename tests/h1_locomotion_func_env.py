@@ -0,0 +1,91 @@
+def main():
+    from internutopia.core import func_env
+    from internutopia.core.config import Config, SimConfig
+    from internutopia.core.util import has_display
+    from internutopia.macros import gm
+    from internutopia_extension import import_extensions
+    from internutopia_extension.configs.robots.h1 import (
+        H1RobotCfg,
+        move_along_path_cfg,
+        move_by_speed_cfg,
+        rotate_cfg,
+    )
+    from internutopia_extension.configs.tasks import FiniteStepTaskCfg
+
+    headless = False
+    if not has_display():
+        headless = True
+
+    h1 = H1RobotCfg(
+        position=(0.0, 0.0, 1.05),
+        controllers=[
+            move_by_speed_cfg,
+            move_along_path_cfg,
+            rotate_cfg,
+        ],
+        sensors=[],
+    )
+
+    config = Config(
+        simulator=SimConfig(physics_dt=1 / 240, rendering_dt=1 / 240, use_fabric=True, headless=headless),
+        task_configs=[
+            FiniteStepTaskCfg(
+                max_steps=300,
+                scene_asset_path=gm.ASSET_PATH + '/scenes/empty.usd',
+                scene_scale=(0.01, 0.01, 0.01),
+                robots=[h1],
+            )
+            for _ in range(2)
+        ],
+    )
+
+    print(config.model_dump_json(indent=4))
+
+    import_extensions()
+
+    runner, state = func_env.make(config)
+    assert state.episode == 0 and state.task_config is None
+
+    move_action = {move_by_speed_cfg.name: [1, 0, 0]}
+    episodes = 0
+    obs, state = func_env.reset(runner, state)
+
+    while runner.simulation_app.is_running():
+        if state.task_config is None:
+            break
+        episodes += 1
+        assert state.episode == episodes
+        assert 'position' in obs
+
+        i = 0
+        terminated = False
+        while not terminated:
+            i += 1
+            prev_state = state
+            obs, state, _, terminated, _ = func_env.step(runner, state, move_action)
+            assert state.terminated == terminated
+            assert terminated or state is prev_state, 'state should be reused while nothing changes'
+            if i % 100 == 0:
+                print(i)
+                pos = obs['position']
+                assert pos[0] < 5.0 and pos[1] < 5.0 and pos[2] < 2.0, 'out of range'
+
+        obs, state = func_env.reset(runner, state)
+
+    assert episodes == 2
+    obs, state, _, terminated, _ = func_env.step(runner, state, move_action)
+    assert obs == {} and terminated, 'step without episode should be terminated'
+
+    func_env.close(runner)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f'exception is {e}')
+        import sys
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,75 @@
+def main():
+    from collections import OrderedDict
+
+    from internutopia.core.config import Config, SimConfig
+    from internutopia.core.vec_env import Env
+    from internutopia.core.util import has_display
+    from internutopia.macros import gm
+    from internutopia_extension import import_extensions
+    from internutopia_extension.configs.robots.h1 import (
+        H1RobotCfg,
+        move_along_path_cfg,
+        move_by_speed_cfg,
+        rotate_cfg,
+    )
+    from internutopia_extension.configs.tasks import FiniteStepTaskCfg
+
+    headless = False
+    if not has_display():
+        headless = True
+
+    h1 = H1RobotCfg(
+        position=(0.0, 0.0, 1.05),
+        controllers=[
+            move_by_speed_cfg,
+            move_along_path_cfg,
+            rotate_cfg,
+        ],
+        sensors=[],
+    )
+
+    config = Config(
+        simulator=SimConfig(physics_dt=1 / 240, rendering_dt=1 / 240, use_fabric=True, headless=headless),
+        env_num=2,
+        env_offset_size=10,
+        task_configs=[
+            FiniteStepTaskCfg(
+                max_steps=500,
+                scene_asset_path=gm.ASSET_PATH + '/scenes/empty.usd',
+                scene_scale=(0.01, 0.01, 0.01),
+                robots=[h1],
+            )
+            for _ in range(2)
+        ],
+    )
+
+    print(config.model_dump_json(indent=4))
+
+    import_extensions()
+
+    move_action = {move_by_speed_cfg.name: [1, 0, 0]}
+
+    with Env(config) as env:
+        obs, _ = env.reset()
+        assert len(obs) == 2
+        for i in range(100):
+            obs, _, terminated_status, _, _ = env.step(action=[OrderedDict({'h1': move_action}) for _ in range(2)])
+            assert len(obs) == 2
+            assert len(terminated_status) == 2
+            if i % 50 == 0:
+                print(i)
+
+    # Already closed by the context manager.
+    env.close()
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f'exception is {e}')
+        import sys
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
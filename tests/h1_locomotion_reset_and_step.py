@@ -0,0 +1,87 @@
+def main():
+    from internutopia.core.config import Config, SimConfig
+    from internutopia.core.gym_env import Env
+    from internutopia.core.util import has_display
+    from internutopia.macros import gm
+    from internutopia_extension import import_extensions
+    from internutopia_extension.configs.robots.h1 import (
+        H1RobotCfg,
+        move_along_path_cfg,
+        move_by_speed_cfg,
+        rotate_cfg,
+    )
+    from internutopia_extension.configs.tasks import FiniteStepTaskCfg
+
+    headless = False
+    if not has_display():
+        headless = True
+
+    h1 = H1RobotCfg(
+        position=(0.0, 0.0, 1.05),
+        controllers=[
+            move_by_speed_cfg,
+            move_along_path_cfg,
+            rotate_cfg,
+        ],
+        sensors=[],
+    )
+
+    config = Config(
+        simulator=SimConfig(physics_dt=1 / 240, rendering_dt=1 / 240, use_fabric=True, headless=headless),
+        task_configs=[
+            FiniteStepTaskCfg(
+                max_steps=300,
+                scene_asset_path=gm.ASSET_PATH + '/scenes/empty.usd',
+                scene_scale=(0.01, 0.01, 0.01),
+                robots=[h1],
+            )
+            for _ in range(2)
+        ],
+    )
+
+    print(config.model_dump_json(indent=4))
+
+    import_extensions()
+
+    env = Env(config)
+    move_action = {move_by_speed_cfg.name: [1, 0, 0]}
+
+    obs, _ = env.reset()
+    assert 'position' in obs
+
+    i = 0
+    terminated = False
+    while env.simulation_app.is_running() and not terminated:
+        i += 1
+        obs, _, terminated, _, _ = env.step(action=move_action)
+    assert i > 200, 'episode ended before max steps'
+
+    # Second episode started without collecting the discarded reset observation.
+    obs, _, terminated, _, info = env.reset_and_step(move_action)
+    assert 'position' in obs and not terminated
+    task_config = info[Env.RESET_INFO_TASK_CONFIG]
+    assert task_config is not None
+
+    # The info of reset_and_step is not cleared by the next step.
+    env.step(action=move_action)
+    assert info[Env.RESET_INFO_TASK_CONFIG] is task_config
+
+    while env.simulation_app.is_running() and not terminated:
+        obs, _, terminated, _, _ = env.step(action=move_action)
+
+    obs, _, terminated, _, info = env.reset_and_step(move_action)
+    assert obs is None and terminated, 'no more episodes should be left'
+
+    env.close()
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f'exception is {e}')
+        import sys
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,78 @@
+def main():
+    from internutopia.core.config import Config, SimConfig
+    from internutopia.core.gym_env import Env
+    from internutopia.core.util import has_display
+    from internutopia.macros import gm
+    from internutopia_extension import import_extensions
+    from internutopia_extension.configs.robots.h1 import (
+        H1RobotCfg,
+        move_along_path_cfg,
+        move_by_speed_cfg,
+        rotate_cfg,
+    )
+    from internutopia_extension.configs.tasks import FiniteStepTaskCfg
+
+    headless = False
+    if not has_display():
+        headless = True
+
+    h1 = H1RobotCfg(
+        position=(0.0, 0.0, 1.05),
+        controllers=[
+            move_by_speed_cfg,
+            move_along_path_cfg,
+            rotate_cfg,
+        ],
+        sensors=[],
+    )
+
+    config = Config(
+        simulator=SimConfig(physics_dt=1 / 240, rendering_dt=1 / 240, use_fabric=True, headless=headless),
+        task_configs=[
+            FiniteStepTaskCfg(
+                max_steps=300,
+                scene_asset_path=gm.ASSET_PATH + '/scenes/empty.usd',
+                scene_scale=(0.01, 0.01, 0.01),
+                robots=[h1],
+            )
+            for _ in range(2)
+        ],
+    )
+
+    print(config.model_dump_json(indent=4))
+
+    import_extensions()
+
+    env = Env(config)
+    move_action = {move_by_speed_cfg.name: [1, 0, 0]}
+
+    obs, _ = env.reset()
+
+    trajectory = env.rollout(lambda _obs: move_action, 100, obs)
+    assert trajectory['obs']['position'].shape == (100, 3)
+    assert len(trajectory['actions']) == 100
+    assert trajectory['rewards'].shape == (100,)
+    assert trajectory['terminated'].shape == (100,) and not trajectory['terminated'].any()
+    assert trajectory['truncated'].shape == (100,)
+    pos = trajectory['last_obs']['position']
+    assert pos[0] < 5.0 and pos[1] < 5.0 and pos[2] < 2.0, 'out of range'
+
+    # Stops early when the episode ends, starting from the current observation.
+    trajectory = env.rollout(lambda _obs: move_action, 1000)
+    steps = len(trajectory['rewards'])
+    assert steps < 1000 and trajectory['terminated'][-1]
+    assert trajectory['obs']['position'].shape == (steps, 3)
+
+    env.close()
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f'exception is {e}')
+        import sys
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,85 @@
+def main():
+    from internutopia.core.config import Config, SimConfig
+    from internutopia.core.gym_env import Env
+    from internutopia.core.util import has_display
+    from internutopia.macros import gm
+    from internutopia_extension import import_extensions
+    from internutopia_extension.configs.robots.h1 import (
+        H1RobotCfg,
+        move_along_path_cfg,
+        move_by_speed_cfg,
+        rotate_cfg,
+    )
+    from internutopia_extension.configs.tasks import FiniteStepTaskCfg
+
+    headless = False
+    if not has_display():
+        headless = True
+
+    h1 = H1RobotCfg(
+        position=(0.0, 0.0, 1.05),
+        controllers=[
+            move_by_speed_cfg,
+            move_along_path_cfg,
+            rotate_cfg,
+        ],
+        sensors=[],
+    )
+
+    config = Config(
+        simulator=SimConfig(physics_dt=1 / 240, rendering_dt=1 / 240, use_fabric=True, headless=headless),
+        task_configs=[
+            FiniteStepTaskCfg(
+                max_steps=500,
+                scene_asset_path=gm.ASSET_PATH + '/scenes/empty.usd',
+                scene_scale=(0.01, 0.01, 0.01),
+                robots=[h1],
+            )
+            for _ in range(3)
+        ],
+    )
+
+    print(config.model_dump_json(indent=4))
+
+    import_extensions()
+
+    move_action = {move_by_speed_cfg.name: [1, 0, 0]}
+
+    env = Env(config)
+    shared_env = Env(config, runner=env.runner)
+    assert shared_env.runner is env.runner
+
+    obs, info = env.reset()
+    assert 'position' in obs and Env.RESET_INFO_TASK_CONFIG in info
+    for _ in range(100):
+        env.step(action=move_action)
+
+    # The simulator stays open while another env still uses the runner, and closing twice is a no-op.
+    env.close()
+    env.close()
+    assert shared_env.simulation_app.is_running(), 'shared runner closed by the first env'
+
+    with shared_env:
+        obs, info = shared_env.reset()
+        assert 'position' in obs and Env.RESET_INFO_TASK_CONFIG in info
+        for i in range(100):
+            obs, _, _, _, _ = shared_env.step(action=move_action)
+            if i % 50 == 0:
+                print(i)
+                pos = obs['position']
+                assert pos[0] < 5.0 and pos[1] < 5.0 and pos[2] < 2.0, 'out of range'
+
+    # Already closed by the context manager.
+    shared_env.close()
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f'exception is {e}')
+        import sys
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,85 @@
+def main():
+    import numpy as np
+
+    from internutopia.core.config import Config, SimConfig
+    from internutopia.core.gym_env import Env
+    from internutopia.core.util import has_display
+    from internutopia.macros import gm
+    from internutopia_extension import import_extensions
+    from internutopia_extension.configs.robots.h1 import (
+        H1RobotCfg,
+        move_along_path_cfg,
+        move_by_speed_cfg,
+        rotate_cfg,
+    )
+    from internutopia_extension.configs.tasks import FiniteStepTaskCfg
+
+    headless = False
+    if not has_display():
+        headless = True
+
+    h1 = H1RobotCfg(
+        position=(0.0, 0.0, 1.05),
+        controllers=[
+            move_by_speed_cfg,
+            move_along_path_cfg,
+            rotate_cfg,
+        ],
+        sensors=[],
+    )
+
+    config = Config(
+        simulator=SimConfig(physics_dt=1 / 240, rendering_dt=1 / 240, use_fabric=True, headless=headless),
+        task_configs=[
+            FiniteStepTaskCfg(
+                max_steps=300,
+                scene_asset_path=gm.ASSET_PATH + '/scenes/empty.usd',
+                scene_scale=(0.01, 0.01, 0.01),
+                robots=[h1],
+            )
+            for _ in range(2)
+        ],
+    )
+
+    print(config.model_dump_json(indent=4))
+
+    import_extensions()
+
+    env = Env(config)
+    move_action = {move_by_speed_cfg.name: [1, 0, 0]}
+
+    obs, _ = env.reset()
+
+    obs_out = {'position': np.zeros(3, dtype=np.float32), 'orientation': np.zeros(4, dtype=np.float32)}
+    rew_out = np.zeros(1, dtype=np.float32)
+    done_out = np.zeros(1, dtype=bool)
+    trunc_out = np.zeros(1, dtype=bool)
+
+    i = 0
+    while env.simulation_app.is_running():
+        i += 1
+        env.step_into(move_action, obs_out, rew_out, done_out, trunc_out)
+        if done_out[0]:
+            break
+        assert np.allclose(obs_out['position'], env.get_observations()['position'], atol=1e-5)
+        if i % 100 == 0:
+            print(i)
+            pos = obs_out['position']
+            assert pos[0] < 5.0 and pos[1] < 5.0 and pos[2] < 2.0, 'out of range'
+
+    assert i > 200, 'episode ended before max steps'
+    assert not trunc_out[0]
+
+    env.close()
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f'exception is {e}')
+        import sys
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,100 @@
+def main():
+    import numpy as np
+
+    from internutopia.core.config import Config, SimConfig
+    from internutopia.core.gym_env import VectorEnv
+    from internutopia.core.util import has_display
+    from internutopia.macros import gm
+    from internutopia_extension import import_extensions
+    from internutopia_extension.configs.robots.h1 import (
+        H1RobotCfg,
+        move_along_path_cfg,
+        move_by_speed_cfg,
+        rotate_cfg,
+    )
+    from internutopia_extension.configs.tasks import FiniteStepTaskCfg
+
+    headless = False
+    if not has_display():
+        headless = True
+
+    h1 = H1RobotCfg(
+        position=(0.0, 0.0, 1.05),
+        controllers=[
+            move_by_speed_cfg,
+            move_along_path_cfg,
+            rotate_cfg,
+        ],
+        sensors=[],
+    )
+
+    config = Config(
+        simulator=SimConfig(
+            physics_dt=1 / 240, rendering_dt=1 / 240, use_fabric=True, rendering_interval=20, headless=headless
+        ),
+        env_num=4,
+        env_offset_size=10,
+        task_configs=[
+            FiniteStepTaskCfg(
+                max_steps=300,
+                scene_asset_path=gm.ASSET_PATH + '/scenes/empty.usd',
+                scene_scale=(0.01, 0.01, 0.01),
+                robots=[h1],
+            )
+            for _ in range(6)
+        ],
+    )
+
+    print(config.model_dump_json(indent=4))
+
+    import_extensions()
+
+    env = VectorEnv(config)
+    obs, info = env.reset()
+    assert obs['position'].shape == (4, 3)
+    assert obs['orientation'].shape == (4, 4)
+    assert len(info['task_config']) == 4
+
+    i = 0
+
+    move_action = {move_by_speed_cfg.name: [1, 0, 0]}
+    finished_env_ids = set()
+
+    while env.simulation_app.is_running():
+        i += 1
+        obs, rewards, terminated_status, truncated_status, _ = env.step([move_action] * 4)
+
+        assert obs['position'].shape == (4, 3)
+        assert rewards.shape == (4,) and terminated_status.shape == (4,) and truncated_status.shape == (4,)
+        for env_id in finished_env_ids:
+            assert not np.any(obs['position'][env_id]), 'finished env should be zero-filled'
+
+        if i % 100 == 0:
+            print(i)
+
+        reset_env_ids = [idx for idx, term in enumerate(terminated_status) if term and idx not in finished_env_ids]
+        if reset_env_ids:
+            obs, info = env.reset(options={'env_ids': reset_env_ids})
+            assert obs['position'].shape == (4, 3)
+            assert len(info['task_config']) == len(reset_env_ids)
+            finished_env_ids.update(idx for idx, cfg in zip(reset_env_ids, info['task_config']) if cfg is None)
+
+        if len(finished_env_ids) == 4:
+            break
+
+    # 6 episodes over 4 envs: the first 2 envs to finish run a second episode.
+    assert i > 400, 'second round of episodes should have run'
+
+    env.close()
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f'exception is {e}')
+        import sys
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)